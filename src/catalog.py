@@ -3,13 +3,18 @@ Fixed specialty catalog to prevent hallucination.
 Defines all medical specialties with metadata for scoring.
 """
 
-from typing import Literal
-from pydantic import BaseModel, Field
+from functools import cache
+from typing import Iterable, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Specialty(BaseModel):
     """A medical specialty with metadata for relevance scoring."""
 
+    # Catalog entries are shared module-level constants: immutable and hashable
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique identifier")
     display_name: str = Field(..., description="Human-readable name")
     type: Literal["generalist", "medical", "surgical"] = Field(..., description="Specialty category")
@@ -37,8 +42,8 @@ class Specialty(BaseModel):
         le=1.0,
         description="Likelihood of procedural/surgical intervention"
     )
-    keywords: list[str] = Field(
-        default_factory=list,
+    keywords: tuple[str, ...] = Field(
+        default=(),
         description="Keywords associated with this specialty"
     )
 
@@ -430,12 +435,17 @@ def get_catalog() -> list[Specialty]:
     return SPECIALTY_CATALOG
 
 
+# The @cache helpers below build their lookup once: SPECIALTY_CATALOG is fixed,
+# so the cached results never go stale.
+@cache
+def _specialty_index() -> dict[str, Specialty]:
+    """Map of specialty ID to Specialty."""
+    return {spec.id: spec for spec in SPECIALTY_CATALOG}
+
+
 def get_specialty_by_id(specialty_id: str) -> Specialty | None:
     """Lookup a specialty by ID."""
-    for spec in SPECIALTY_CATALOG:
-        if spec.id == specialty_id:
-            return spec
-    return None
+    return _specialty_index().get(specialty_id)
 
 
 def get_specialty_ids() -> list[str]:
@@ -443,16 +453,33 @@ def get_specialty_ids() -> list[str]:
     return [spec.id for spec in SPECIALTY_CATALOG]
 
 
+@cache
+def get_specialty_id_set() -> frozenset[str]:
+    """Return all specialty IDs as a frozenset."""
+    return frozenset(get_specialty_ids())
+
+
 def validate_specialty_ids(ids: list[str]) -> tuple[bool, list[str]]:
     """
     Validate that all IDs are in the catalog.
     Returns (is_valid, invalid_ids).
     """
-    valid_ids = set(get_specialty_ids())
+    valid_ids = get_specialty_id_set()
     invalid = [sid for sid in ids if sid not in valid_ids]
-    return len(invalid) == 0, invalid
+    return not invalid, invalid
+
+
+def validate_specialty_ids_batch(ids: Iterable[str]) -> set[str]:
+    """
+    Return the set of IDs not in the catalog (empty if all are valid).
+
+    Accepts any iterable, so callers can check IDs gathered from several
+    sources with a single set difference.
+    """
+    return set(ids) - get_specialty_id_set()
 
 
-def get_generalist_ids() -> list[str]:
+@cache
+def get_generalist_ids() -> frozenset[str]:
     """Return IDs of generalist specialties."""
-    return [spec.id for spec in SPECIALTY_CATALOG if spec.type == "generalist"]
+    return frozenset(spec.id for spec in SPECIALTY_CATALOG if spec.type == "generalist")
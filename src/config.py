@@ -73,6 +73,10 @@ class VLLMConfig(BaseSettings):
     base_url: str = Field(default="http://localhost:8000", description="vLLM server URL")
     use_chat_api: bool = Field(default=True, description="Use /v1/chat/completions instead of /v1/completions")
     timeout: int = Field(default=300, description="Request timeout in seconds")
+    http2: bool = Field(
+        default=False,
+        description="Multiplex concurrent requests over one HTTP/2 connection (https endpoints only)"
+    )
 
 
 class Config(BaseSettings):
@@ -2,8 +2,14 @@
 Utility functions for JSON parsing from LLM responses.
 """
 
-import json
 import re
+from typing import TypeVar
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def extract_json_from_llm_response(text: str) -> dict:
@@ -23,10 +29,17 @@ def extract_json_from_llm_response(text: str) -> dict:
         Parsed JSON dict
 
     Raises:
-        json.JSONDecodeError: If no valid JSON found
+        json.JSONDecodeError: If no valid JSON found (orjson's error subclasses it)
     """
     text = text.strip()
 
+    # Fast path: JSON-mode responses are already clean JSON
+    if text.startswith('{'):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
     # Remove markdown code blocks if present
     if text.startswith("```json"):
         text = text[7:]
@@ -61,4 +74,35 @@ def extract_json_from_llm_response(text: str) -> dict:
     # Remove multi-line comments (/* ... */)
     text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
 
-    return json.loads(text)
+    return orjson.loads(text)
+
+
+def parse_llm_response_as(text: str, model: type[ModelT]) -> ModelT:
+    """
+    Parse an LLM response directly into a pydantic model.
+
+    Clean JSON responses are parsed and validated in a single pass by
+    pydantic-core (no intermediate dict); anything else is cleaned up with
+    extract_json_from_llm_response() first.
+
+    Args:
+        text: Raw LLM response
+        model: Pydantic model class to validate against
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON found
+        pydantic.ValidationError: If the JSON does not match the schema
+    """
+    stripped = text.strip()
+    if stripped.startswith('{'):
+        try:
+            return model.model_validate_json(stripped)
+        except ValidationError as e:
+            # Only fall back for malformed JSON; schema errors would just repeat
+            if not any(err["type"] == "json_invalid" for err in e.errors()):
+                raise
+
+    return model.model_validate(extract_json_from_llm_response(text))
@@ -4,8 +4,10 @@ Supports OpenAI, Anthropic, and mock clients for testing.
 """
 
 import json
+import threading
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional
 
 from openai import OpenAI
@@ -14,22 +16,15 @@ from anthropic import Anthropic
 from .config import Config
 
 
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
-    """Standardized response from LLM."""
-
-    def __init__(
-        self,
-        content: str,
-        model: str,
-        tokens_used: Optional[int] = None,
-        latency_seconds: float = 0.0,
-        raw_response: Optional[dict] = None
-    ):
-        self.content = content
-        self.model = model
-        self.tokens_used = tokens_used
-        self.latency_seconds = latency_seconds
-        self.raw_response = raw_response
+    """Standardized response from LLM (immutable, so it can be shared)."""
+
+    content: str
+    model: str
+    tokens_used: Optional[int] = None
+    latency_seconds: float = 0.0
+    raw_response: Optional[dict] = None
 
 
 class LLMClient(ABC):
@@ -45,7 +40,9 @@ class LLMClient(ABC):
 
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.).
+                Pass response_format="json" to request JSON-only output from
+                providers that support it; others ignore it.
 
         Returns:
             LLMResponse object
@@ -67,6 +64,10 @@ class OpenAIClient(LLMClient):
         max_tokens = kwargs.get("max_tokens", self.config.max_output_tokens)
         model = kwargs.get("model", self.config.model)
 
+        extra = {}
+        if kwargs.get("response_format") == "json":
+            extra["response_format"] = {"type": "json_object"}
+
         start = time.time()
 
         response = self.client.chat.completions.create(
@@ -74,6 +75,7 @@ class OpenAIClient(LLMClient):
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
             max_tokens=max_tokens,
+            **extra,
         )
 
         latency = time.time() - start
@@ -133,22 +135,129 @@ class AnthropicClient(LLMClient):
         )
 
 
+# Canned agent payloads for MockLLMClient, serialized once at import
+_MOCK_PLANNER_JSON = json.dumps({
+    "triage_generalist": "emergency_medicine",
+    "scored_catalog": [
+        {
+            "specialty_id": "cardiology",
+            "relevance": 0.9,
+            "coverage_gain": 0.8,
+            "urgency_alignment": 0.9,
+            "procedural_signal": 0.3,
+            "reason": "Cardiac symptoms"
+        },
+        {
+            "specialty_id": "pulmonology",
+            "relevance": 0.6,
+            "coverage_gain": 0.5,
+            "urgency_alignment": 0.7,
+            "procedural_signal": 0.2,
+            "reason": "Respiratory differential"
+        },
+        {
+            "specialty_id": "gastroenterology",
+            "relevance": 0.4,
+            "coverage_gain": 0.4,
+            "urgency_alignment": 0.3,
+            "procedural_signal": 0.2,
+            "reason": "GI causes possible"
+        },
+        {
+            "specialty_id": "emergency_medicine",
+            "relevance": 1.0,
+            "coverage_gain": 0.9,
+            "urgency_alignment": 1.0,
+            "procedural_signal": 0.3,
+            "reason": "Acute presentation"
+        },
+        {
+            "specialty_id": "neurology",
+            "relevance": 0.3,
+            "coverage_gain": 0.3,
+            "urgency_alignment": 0.4,
+            "procedural_signal": 0.1,
+            "reason": "Low relevance"
+        }
+    ],
+    "selected_specialties": ["cardiology", "pulmonology", "gastroenterology", "emergency_medicine", "neurology"],
+    "rationale": "Mock planner rationale"
+})
+
+_MOCK_SPECIALIST_JSON = json.dumps({
+    "specialty_id": "cardiology",
+    "differential": [
+        {
+            "dx": "Acute Myocardial Infarction",
+            "p": 0.7,
+            "evidence_for": ["chest pain", "radiation to arm"],
+            "evidence_against": [],
+            "discriminators": ["ECG", "troponin"]
+        }
+    ],
+    "notes": "Mock specialist notes"
+})
+
+_MOCK_AGGREGATOR_JSON = json.dumps({
+    "final_answer": "B",
+    "ordered_differential": [
+        {
+            "dx": "Acute Myocardial Infarction",
+            "p": 0.75,
+            "evidence_for": ["chest pain", "radiation"],
+            "evidence_against": [],
+            "discriminators": ["ECG", "troponin"]
+        }
+    ],
+    "justification": "Mock aggregator justification",
+    "warnings": []
+})
+
+# Responses are immutable, so every call can hand out the same instance
+_MOCK_PLANNER_RESPONSE = LLMResponse(
+    content=_MOCK_PLANNER_JSON,
+    model="mock-model",
+    tokens_used=200,
+    latency_seconds=0.2
+)
+
+_MOCK_SPECIALIST_RESPONSE = LLMResponse(
+    content=_MOCK_SPECIALIST_JSON,
+    model="mock-model",
+    tokens_used=150,
+    latency_seconds=0.15
+)
+
+_MOCK_AGGREGATOR_RESPONSE = LLMResponse(
+    content=_MOCK_AGGREGATOR_JSON,
+    model="mock-model",
+    tokens_used=180,
+    latency_seconds=0.18
+)
+
+
 class MockLLMClient(LLMClient):
     """Mock LLM client for testing (returns predefined responses)."""
 
     def __init__(self, config: Config, mock_responses: Optional[dict] = None):
         super().__init__(config)
-        self.mock_responses = mock_responses or {}
+        # Dict payloads are serialized up front rather than on every matching call
+        self.mock_responses = {
+            key: response if isinstance(response, str) else json.dumps(response)
+            for key, response in (mock_responses or {}).items()
+        }
         self.call_count = 0
+        # Specialists may call complete() from several threads at once
+        self._count_lock = threading.Lock()
 
     def complete(self, prompt: str, **kwargs) -> LLMResponse:
         """Return a mock response."""
-        self.call_count += 1
+        with self._count_lock:
+            self.call_count += 1
 
         # Check if we have a specific mock for this prompt pattern
-        for key, response in self.mock_responses.items():
+        for key, content in self.mock_responses.items():
             if key in prompt:
-                content = response if isinstance(response, str) else json.dumps(response)
                 return LLMResponse(
                     content=content,
                     model="mock-model",
@@ -201,105 +310,16 @@ class MockLLMClient(LLMClient):
             return self._mock_cot_response()
 
     def _mock_planner_response(self) -> LLMResponse:
-        """Generate a mock planner response."""
-        response = {
-            "triage_generalist": "emergency_medicine",
-            "scored_catalog": [
-                {
-                    "specialty_id": "cardiology",
-                    "relevance": 0.9,
-                    "coverage_gain": 0.8,
-                    "urgency_alignment": 0.9,
-                    "procedural_signal": 0.3,
-                    "reason": "Cardiac symptoms"
-                },
-                {
-                    "specialty_id": "pulmonology",
-                    "relevance": 0.6,
-                    "coverage_gain": 0.5,
-                    "urgency_alignment": 0.7,
-                    "procedural_signal": 0.2,
-                    "reason": "Respiratory differential"
-                },
-                {
-                    "specialty_id": "gastroenterology",
-                    "relevance": 0.4,
-                    "coverage_gain": 0.4,
-                    "urgency_alignment": 0.3,
-                    "procedural_signal": 0.2,
-                    "reason": "GI causes possible"
-                },
-                {
-                    "specialty_id": "emergency_medicine",
-                    "relevance": 1.0,
-                    "coverage_gain": 0.9,
-                    "urgency_alignment": 1.0,
-                    "procedural_signal": 0.3,
-                    "reason": "Acute presentation"
-                },
-                {
-                    "specialty_id": "neurology",
-                    "relevance": 0.3,
-                    "coverage_gain": 0.3,
-                    "urgency_alignment": 0.4,
-                    "procedural_signal": 0.1,
-                    "reason": "Low relevance"
-                }
-            ],
-            "selected_specialties": ["cardiology", "pulmonology", "gastroenterology", "emergency_medicine", "neurology"],
-            "rationale": "Mock planner rationale"
-        }
-        return LLMResponse(
-            content=json.dumps(response),
-            model="mock-model",
-            tokens_used=200,
-            latency_seconds=0.2
-        )
+        """Return the canned planner response."""
+        return _MOCK_PLANNER_RESPONSE
 
     def _mock_specialist_response(self) -> LLMResponse:
-        """Generate a mock specialist response."""
-        response = {
-            "specialty_id": "cardiology",
-            "differential": [
-                {
-                    "dx": "Acute Myocardial Infarction",
-                    "p": 0.7,
-                    "evidence_for": ["chest pain", "radiation to arm"],
-                    "evidence_against": [],
-                    "discriminators": ["ECG", "troponin"]
-                }
-            ],
-            "notes": "Mock specialist notes"
-        }
-        return LLMResponse(
-            content=json.dumps(response),
-            model="mock-model",
-            tokens_used=150,
-            latency_seconds=0.15
-        )
+        """Return the canned specialist response."""
+        return _MOCK_SPECIALIST_RESPONSE
 
     def _mock_aggregator_response(self) -> LLMResponse:
-        """Generate a mock aggregator response."""
-        response = {
-            "final_answer": "B",
-            "ordered_differential": [
-                {
-                    "dx": "Acute Myocardial Infarction",
-                    "p": 0.75,
-                    "evidence_for": ["chest pain", "radiation"],
-                    "evidence_against": [],
-                    "discriminators": ["ECG", "troponin"]
-                }
-            ],
-            "justification": "Mock aggregator justification",
-            "warnings": []
-        }
-        return LLMResponse(
-            content=json.dumps(response),
-            model="mock-model",
-            tokens_used=180,
-            latency_seconds=0.18
-        )
+        """Return the canned aggregator response."""
+        return _MOCK_AGGREGATOR_RESPONSE
 
     def _mock_cot_response(self) -> LLMResponse:
         """Generate a mock chain-of-thought response for baseline methods."""
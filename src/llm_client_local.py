@@ -7,12 +7,36 @@ import json
 import time
 from typing import Optional
 
-import requests
+import httpx
 
 from .config import Config
 from .llm_client import LLMClient, LLMResponse
 
 
+def _create_http_client(config: Config, http2: bool = False) -> httpx.Client:
+    """
+    Create a pooled HTTP client shared by all calls on one LLM client.
+
+    Keep-alive connections are reused across calls, so repeated requests
+    to the same server skip the TCP/TLS handshake. httpx.Client is
+    thread-safe, so one client can serve concurrent specialist calls.
+    With http2=True, concurrent requests to an https endpoint are
+    multiplexed over a single connection (plain-http servers such as
+    Ollama keep using HTTP/1.1). Redirects are followed (e.g. an http
+    base_url behind an https proxy), as requests.post() used to do.
+    """
+    max_connections = max(config.safety.max_concurrent_calls, 1)
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        timeout=config.budgets.timeout_seconds,
+        http2=http2,
+        follow_redirects=True,
+    )
+
+
 class OllamaClient(LLMClient):
     """
     Client for locally-hosted Ollama models.
@@ -34,6 +58,7 @@ class OllamaClient(LLMClient):
     def __init__(self, config: Config, base_url: str = "http://localhost:11434"):
         super().__init__(config)
         self.base_url = base_url.rstrip("/")
+        self._http = _create_http_client(config)
 
     def complete(self, prompt: str, **kwargs) -> LLMResponse:
         """Generate completion using Ollama API."""
@@ -53,11 +78,13 @@ class OllamaClient(LLMClient):
                 "num_predict": max_tokens,
             }
         }
+        if kwargs.get("response_format") == "json":
+            payload["format"] = "json"
 
         start = time.time()
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 url,
                 json=payload,
                 timeout=kwargs.get("timeout", self.config.budgets.timeout_seconds)
@@ -84,12 +111,12 @@ class OllamaClient(LLMClient):
                 raw_response=result
             )
 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise RuntimeError(
                 "Cannot connect to Ollama. "
                 "Make sure Ollama is running: 'ollama serve'"
             )
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             actual_timeout = kwargs.get("timeout", self.config.budgets.timeout_seconds)
             raise RuntimeError(
                 f"Ollama request timed out after {actual_timeout}s"
@@ -116,6 +143,7 @@ class LlamaCppClient(LLMClient):
     def __init__(self, config: Config, base_url: str = "http://localhost:8080"):
         super().__init__(config)
         self.base_url = base_url.rstrip("/")
+        self._http = _create_http_client(config)
 
     def complete(self, prompt: str, **kwargs) -> LLMResponse:
         """Generate completion using llama.cpp server."""
@@ -135,7 +163,7 @@ class LlamaCppClient(LLMClient):
         start = time.time()
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 url,
                 json=payload,
                 timeout=kwargs.get("timeout", self.config.budgets.timeout_seconds)
@@ -156,7 +184,7 @@ class LlamaCppClient(LLMClient):
                 raw_response=result
             )
 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise RuntimeError(
                 "Cannot connect to llama.cpp server. "
                 "Make sure server is running on port 8080"
@@ -187,6 +215,7 @@ class VLLMClient(LLMClient):
         vllm:
           base_url: "https://your-pod-id.proxy.runpod.net"
           use_chat_api: true  # Use /v1/chat/completions (better for instruct models)
+          http2: true  # Multiplex concurrent calls on one connection (https proxies)
     """
 
     def __init__(self, config: Config, base_url: Optional[str] = None):
@@ -201,6 +230,8 @@ class VLLMClient(LLMClient):
         vllm_config = getattr(config, 'vllm', None)
         self.use_chat_api = vllm_config.use_chat_api if vllm_config else False
 
+        self._http = _create_http_client(config, http2=vllm_config.http2 if vllm_config else False)
+
     def complete(self, prompt: str, **kwargs) -> LLMResponse:
         """Generate completion using vLLM OpenAI-compatible API."""
         temperature = kwargs.get("temperature", self.config.temperature)
@@ -216,6 +247,8 @@ class VLLMClient(LLMClient):
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
+            if kwargs.get("response_format") == "json":
+                payload["response_format"] = {"type": "json_object"}
         else:
             # Use completions API (classic)
             url = f"{self.base_url}/v1/completions"
@@ -229,7 +262,7 @@ class VLLMClient(LLMClient):
         start = time.time()
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 url,
                 json=payload,
                 timeout=kwargs.get("timeout", self.config.budgets.timeout_seconds)
@@ -255,12 +288,12 @@ class VLLMClient(LLMClient):
                 raw_response=result
             )
 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise RuntimeError(
                 f"Cannot connect to vLLM server at {self.base_url}. "
                 "Make sure vLLM is running or RunPod endpoint is correct"
             )
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             actual_timeout = kwargs.get("timeout", self.config.budgets.timeout_seconds)
             raise RuntimeError(
                 f"vLLM request timed out after {actual_timeout}s"
@@ -3,8 +3,8 @@ Logging utilities for trace storage.
 Supports JSONL and SQLite backends.
 """
 
-import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -22,6 +22,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def serialize_trace(trace: CaseTrace) -> bytes:
+    """Serialize a trace to a single compact JSONL record (shared by all trace writers)."""
+    # pydantic-core writes JSON directly, skipping the intermediate model_dump() dict
+    return trace.model_dump_json().encode() + b"\n"
+
+
 class TraceWriter:
     """Abstract base for trace writers."""
 
@@ -48,10 +54,9 @@ class JSONLTraceWriter(TraceWriter):
         # Write trace
         output_file = output_dir / f"{trace.trace_id}.jsonl"
 
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "wb") as f:
             # Write the full trace as a single JSON line
-            f.write(json.dumps(trace.model_dump(), indent=None))
-            f.write("\n")
+            f.write(serialize_trace(trace))
 
         logger.info(f"Trace written to {output_file}")
         return str(output_file)
@@ -72,6 +77,48 @@ class SQLiteTraceWriter(TraceWriter):
         return self.jsonl_writer.write_trace(trace)
 
 
+class BackgroundFileWriter:
+    """
+    Write small files on a background thread.
+
+    Lets per-case trace writes overlap with the next case's LLM calls.
+    Writes are applied in submission order; failures are logged rather
+    than raised so one bad write doesn't abort an evaluation run.
+    Use as a context manager (or call close()) to flush pending writes.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-writer")
+
+    def submit(self, path: str | Path, data: bytes) -> Future:
+        """Queue `data` to be written to `path`."""
+        future = self._executor.submit(_write_bytes, Path(path), data)
+        future.add_done_callback(_log_write_error)
+        return future
+
+    def close(self):
+        """Wait for all pending writes to finish."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BackgroundFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _write_bytes(path: Path, data: bytes) -> Path:
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def _log_write_error(future: Future):
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background trace write failed: {error}")
+
+
 def create_trace_writer(config: Optional[Config] = None) -> TraceWriter:
     """
     Factory function to create a trace writer.
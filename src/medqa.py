@@ -7,15 +7,20 @@ import json
 import random
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
+
+import orjson
 
 from .config import Config, get_config
 from .llm_client import create_llm_client
-from .logging_utils import save_trace
+from .logging_utils import BackgroundFileWriter, save_trace, serialize_trace
 from .orchestration import run_case
 from .schemas import EvaluationResult, CaseTrace
 
 
+# Characters read up front (text mode) to sniff the file format and detect error pages
+_HEAD_CHARS = 1024
+
 # Mock MedQA sample for testing when real data not available
 MOCK_MEDQA_SAMPLE = [
     {
@@ -58,30 +63,25 @@ def load_medqa_subset(
         print(f"Warning: MedQA file not found at {path}, using mock data")
         data = MOCK_MEDQA_SAMPLE.copy()
     else:
-        path_str = str(path)
         try:
             with open(path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
+                # Peek at the head of the file instead of reading it all
+                head = f.read(_HEAD_CHARS)
+                stripped_head = head.lstrip()
+                f.seek(0)
 
                 # Check if file contains error message
-                if "404" in content or "Not Found" in content or len(content) < 100:
+                if _looks_like_error_page(stripped_head):
                     print(f"Warning: MedQA file appears invalid (contains error or too small), using mock data")
                     data = MOCK_MEDQA_SAMPLE.copy()
                 # Try parsing as JSON array first
-                elif content.startswith('['):
-                    data = json.loads(content)
-                # Try parsing as JSONL (one JSON per line)
+                elif stripped_head.startswith('['):
+                    data = json.load(f)
+                # Try parsing as JSONL (one JSON per line), streaming line by line.
+                # Without shuffling only the first n records are needed, so stop early.
                 else:
-                    lines = content.split('\n')
-                    data = []
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            try:
-                                data.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                # Skip invalid lines
-                                continue
+                    limit = None if shuffle else n
+                    data = _read_jsonl(f, limit)
 
                     if not data:
                         print(f"Warning: No valid JSON found in {path}, using mock data")
@@ -91,12 +91,42 @@ def load_medqa_subset(
             data = MOCK_MEDQA_SAMPLE.copy()
 
     if shuffle:
-        random.seed(seed)
-        random.shuffle(data)
+        # A private RNG gives the same order as seeding the global one,
+        # without resetting random state for the caller
+        random.Random(seed).shuffle(data)
 
     return data[:n]
 
 
+def _looks_like_error_page(head: str) -> bool:
+    """Detect failed downloads (e.g. a saved "404: Not Found" page) from the file head."""
+    if len(head.strip()) < 100:
+        return True
+    if head.startswith(('[', '{')):
+        return False
+    return "404" in head or "Not Found" in head
+
+
+def _read_jsonl(f: TextIO, limit: Optional[int] = None) -> list[dict]:
+    """Parse a JSONL stream line by line, skipping invalid lines."""
+    data = []
+    append = data.append
+    loads = orjson.loads
+    for line in f:
+        line = line.strip()
+        # Cheap pre-filter: records are JSON objects/arrays, skip blanks and junk
+        if not line or line[0] not in "{[":
+            continue
+        try:
+            append(loads(line))
+        except orjson.JSONDecodeError:
+            # Skip invalid lines
+            continue
+        if limit is not None and len(data) >= limit:
+            break
+    return data
+
+
 def parse_medqa_item(item: dict) -> tuple[str, list[str], str]:
     """
     Parse a MedQA item into components.
@@ -156,52 +186,53 @@ def evaluate_on_subset(
     total_latency = 0.0
     total_tokens = 0
 
-    for i, item in enumerate(dataset, 1):
-        question, options, answer = parse_medqa_item(item)
-
-        print(f"[{i}/{len(dataset)}] Processing question...")
-
-        try:
-            final_decision, trace = run_case(
-                question=question,
-                options=options,
-                correct_answer=answer,
-                config=config,
-                llm_client=llm_client
-            )
-
-            # Save trace
-            trace_path = output_dir / f"{trace.trace_id}.jsonl"
-            with open(trace_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(trace.model_dump(), indent=2))
-
-            # Track metrics
-            is_correct = trace.is_correct
-            if is_correct:
-                correct_count += 1
-
-            total_latency += trace.total_latency_seconds
-            if trace.total_tokens:
-                total_tokens += trace.total_tokens
-
-            results.append({
-                "question_idx": i,
-                "trace_id": trace.trace_id,
-                "predicted": trace.predicted_answer,
-                "correct": trace.correct_answer,
-                "is_correct": is_correct,
-                "latency": trace.total_latency_seconds,
-                "tokens": trace.total_tokens
-            })
-
-            print(f"  ✓ Predicted: {trace.predicted_answer}, Correct: {trace.correct_answer}, Match: {is_correct}")
-
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            results.append({
-                "question_idx": i,
-                "error": str(e)
-            })
+    # Trace files are flushed when the writer closes, before the summary is saved
+    with BackgroundFileWriter() as trace_writer:
+        for i, item in enumerate(dataset, 1):
+            question, options, answer = parse_medqa_item(item)
+
+            print(f"[{i}/{len(dataset)}] Processing question...")
+
+            try:
+                final_decision, trace = run_case(
+                    question=question,
+                    options=options,
+                    correct_answer=answer,
+                    config=config,
+                    llm_client=llm_client
+                )
+
+                # Save trace (written in the background while the next case runs)
+                trace_path = output_dir / f"{trace.trace_id}.jsonl"
+                trace_writer.submit(trace_path, serialize_trace(trace))
+
+                # Track metrics
+                is_correct = trace.is_correct
+                if is_correct:
+                    correct_count += 1
+
+                total_latency += trace.total_latency_seconds
+                if trace.total_tokens:
+                    total_tokens += trace.total_tokens
+
+                results.append({
+                    "question_idx": i,
+                    "trace_id": trace.trace_id,
+                    "predicted": trace.predicted_answer,
+                    "correct": trace.correct_answer,
+                    "is_correct": is_correct,
+                    "latency": trace.total_latency_seconds,
+                    "tokens": trace.total_tokens
+                })
+
+                print(f"  ✓ Predicted: {trace.predicted_answer}, Correct: {trace.correct_answer}, Match: {is_correct}")
+
+            except Exception as e:
+                print(f"  ✗ Error: {e}")
+                results.append({
+                    "question_idx": i,
+                    "error": str(e)
+                })
 
     # Compute metrics
     n_samples = len(dataset)
@@ -220,8 +251,8 @@ def evaluate_on_subset(
         "results": results
     }
 
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dumps(summary_data, f, indent=2)
+    with open(summary_path, "wb") as f:
+        f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
 
     print(f"\n{'='*60}")
     print(f"Evaluation Complete!")
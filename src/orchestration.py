@@ -4,7 +4,7 @@ Manages budgets, retries, and execution flow.
 """
 
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import uuid4
 
@@ -48,6 +48,26 @@ class OrchestratedCase:
         self.end_time: Optional[datetime] = None
         self.total_tokens: int = 0
 
+        # Monotonic reference for latencies; wall-clock times are derived from start_time
+        self._start_perf: float = 0.0
+
+    def start(self):
+        """Mark the start of execution."""
+        self.start_time = datetime.now()
+        self._start_perf = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since start() on the monotonic clock."""
+        return time.perf_counter() - self._start_perf
+
+    def timestamp_at(self, offset: float) -> str:
+        """ISO timestamp for a point `offset` seconds after start()."""
+        return (self.start_time + timedelta(seconds=offset)).isoformat()
+
+    def finish(self):
+        """Mark the end of execution."""
+        self.end_time = self.start_time + timedelta(seconds=self.elapsed())
+
     def to_trace(self) -> CaseTrace:
         """Convert to CaseTrace schema."""
         if not all([self.planner_trace, self.aggregator_trace, self.final_decision]):
@@ -63,6 +83,7 @@ class OrchestratedCase:
         if self.correct_answer and self.final_decision:
             is_correct = self.final_decision.final_answer == self.correct_answer
 
+        # Validated normally: question/options/correct_answer come from the caller
         return CaseTrace(
             trace_id=self.trace_id,
             question=self.question,
@@ -109,28 +130,30 @@ def run_case(
         llm_client = create_llm_client(config)
 
     case = OrchestratedCase(question, options, correct_answer)
-    case.start_time = datetime.now()
+    case.start()
 
     try:
         # Step 1: Planner
-        planner_start = time.time()
+        planner_start = case.elapsed()
         planner_result, planner_response = run_planner(
             question=question,
             options=options,
             llm_client=llm_client,
             config=config
         )
-        planner_latency = time.time() - planner_start
+        planner_end = case.elapsed()
 
         case.planner_result = planner_result
-        case.planner_trace = AgentTrace(
+        # Traces are assembled from validated agent outputs and our own
+        # timings, so they are built without re-running validation
+        case.planner_trace = AgentTrace.model_construct(
             trace_id=case.trace_id,
             agent_type="planner",
             specialty_id=None,
             input_prompt="[Planner prompt]",  # Simplified; can save full prompt if needed
             output_json=planner_result.model_dump(),
-            timestamp=datetime.now().isoformat(),
-            latency_seconds=planner_latency,
+            timestamp=case.timestamp_at(planner_end),
+            latency_seconds=planner_end - planner_start,
             model=planner_response.model,
             tokens_used=planner_response.tokens_used,
         )
@@ -150,16 +173,18 @@ def run_case(
             config=config
         )
 
+        specialists_timestamp = case.timestamp_at(case.elapsed())
+
         for report, response in specialist_results:
             case.specialist_reports.append(report)
 
-            specialist_trace = AgentTrace(
+            specialist_trace = AgentTrace.model_construct(
                 trace_id=case.trace_id,
                 agent_type="specialist",
                 specialty_id=report.specialty_id,
                 input_prompt="[Specialist prompt]",
                 output_json=report.model_dump(),
-                timestamp=datetime.now().isoformat(),
+                timestamp=specialists_timestamp,
                 latency_seconds=response.latency_seconds,
                 model=response.model,
                 tokens_used=response.tokens_used,
@@ -170,7 +195,7 @@ def run_case(
                 case.total_tokens += response.tokens_used
 
         # Step 3: Aggregator
-        aggregator_start = time.time()
+        aggregator_start = case.elapsed()
         final_decision, aggregator_response = run_aggregator(
             question=question,
             options=options,
@@ -178,17 +203,17 @@ def run_case(
             llm_client=llm_client,
             config=config
         )
-        aggregator_latency = time.time() - aggregator_start
+        aggregator_end = case.elapsed()
 
         case.final_decision = final_decision
-        case.aggregator_trace = AgentTrace(
+        case.aggregator_trace = AgentTrace.model_construct(
             trace_id=case.trace_id,
             agent_type="aggregator",
             specialty_id=None,
             input_prompt="[Aggregator prompt]",
             output_json=final_decision.model_dump(),
-            timestamp=datetime.now().isoformat(),
-            latency_seconds=aggregator_latency,
+            timestamp=case.timestamp_at(aggregator_end),
+            latency_seconds=aggregator_end - aggregator_start,
             model=aggregator_response.model,
             tokens_used=aggregator_response.tokens_used,
         )
@@ -196,7 +221,7 @@ def run_case(
         if aggregator_response.tokens_used:
             case.total_tokens += aggregator_response.tokens_used
 
-        case.end_time = datetime.now()
+        case.finish()
 
         # Check budgets
         total_agents = 1 + len(case.specialist_reports) + 1  # planner + specialists + aggregator
@@ -206,5 +231,5 @@ def run_case(
         return final_decision, case.to_trace()
 
     except Exception as e:
-        case.end_time = datetime.now()
+        case.finish()
         raise RuntimeError(f"Case execution failed: {e}") from e
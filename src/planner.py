@@ -3,20 +3,26 @@ Planner agent: triage, enumerate, score, and select Top-K specialties.
 """
 
 import json
-from pathlib import Path
+from functools import cache
 from typing import Optional
 
-from .catalog import get_catalog, validate_specialty_ids, get_specialty_ids, Specialty
+from .catalog import (
+    get_catalog,
+    get_specialty_id_set,
+    get_specialty_ids,
+    validate_specialty_ids,
+    validate_specialty_ids_batch,
+    Specialty,
+)
 from .config import Config
 from .llm_client import LLMClient, LLMResponse
+from .prompt_utils import load_prompt_template
 from .schemas import PlannerResult
 
 
 def load_planner_prompt() -> str:
     """Load the planner prompt template."""
-    prompt_path = Path(__file__).parent / "prompts" / "planner.txt"
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return load_prompt_template("planner.txt").template
 
 
 def format_catalog_for_prompt(catalog: list[Specialty]) -> str:
@@ -27,6 +33,24 @@ def format_catalog_for_prompt(catalog: list[Specialty]) -> str:
     return "\n".join(lines)
 
 
+@cache
+def _formatted_catalog() -> str:
+    """The fixed catalog formatted for the planner prompt."""
+    return format_catalog_for_prompt(get_catalog())
+
+
+@cache
+def _valid_ids_block() -> str:
+    """Bulleted list of valid specialty IDs for the correction prompt."""
+    return "\n".join(f"  - {sid}" for sid in get_specialty_ids())
+
+
+def _planner_temperature(config: Config) -> float:
+    """Planner-specific temperature if configured, otherwise the default."""
+    planner_temp = config.agent_temperatures.planner
+    return planner_temp if planner_temp is not None else config.temperature
+
+
 def run_planner(
     question: str,
     options: Optional[list[str]],
@@ -45,15 +69,11 @@ def run_planner(
     Returns:
         (PlannerResult, LLMResponse) tuple
     """
-    # Load catalog
-    catalog = get_catalog()
-
-    # Format prompt
-    prompt_template = load_planner_prompt()
-    prompt = prompt_template.format(
+    # Format prompt (template is parsed and the catalog formatted once, then cached)
+    prompt = load_prompt_template("planner.txt").render(
         question=question,
         options=options if options else "None",
-        catalog=format_catalog_for_prompt(catalog),
+        catalog=_formatted_catalog(),
         top_k=config.planner.top_k,
         red_flags=", ".join(config.planner.emergency_red_flags),
         pediatric_signals=", ".join(config.planner.pediatric_signals)
@@ -62,8 +82,8 @@ def run_planner(
     # Call LLM (planner needs more tokens to enumerate all specialties)
     # Use agent-specific temperature if configured, otherwise use default
     # Increased to 3500 for larger models (qwen2.5:32b) that generate verbose reasoning
-    temp = config.agent_temperatures.planner if config.agent_temperatures.planner is not None else config.temperature
-    response = llm_client.complete(prompt, max_tokens=3500, temperature=temp)
+    temp = _planner_temperature(config)
+    response = llm_client.complete(prompt, max_tokens=3500, temperature=temp, response_format="json")
 
     # Parse JSON response
     try:
@@ -84,20 +104,20 @@ def run_planner(
                     llm_client=llm_client,
                     config=config,
                     original_response=response.content,
-                    invalid_ids=invalid_ids,
-                    valid_ids=get_specialty_ids()
+                    invalid_ids=invalid_ids
                 )
             except ValueError as retry_error:
                 # If retry also fails, fall back to filtering out invalid IDs
                 print(f"WARNING: Retry failed, filtering out invalid specialty IDs: {invalid_ids}")
-                valid_selections = [sid for sid in planner_result.selected_specialties if sid not in invalid_ids]
+                all_valid_ids = get_specialty_id_set()
+                valid_selections = [sid for sid in planner_result.selected_specialties if sid in all_valid_ids]
 
                 # Ensure we have at least top_k valid specialties
                 if len(valid_selections) < config.planner.top_k:
                     # Add top-scored valid specialties to reach top_k
-                    all_valid_ids = set(get_specialty_ids())
-                    available_ids = [s.specialty_id for s in planner_result.scored_catalog
-                                    if s.specialty_id in all_valid_ids and s.specialty_id not in valid_selections]
+                    selected = set(valid_selections)
+                    available_ids = {s.specialty_id for s in planner_result.scored_catalog
+                                     if s.specialty_id in all_valid_ids and s.specialty_id not in selected}
                     # Sort by relevance score
                     available_sorted = sorted(
                         [s for s in planner_result.scored_catalog if s.specialty_id in available_ids],
@@ -113,9 +133,8 @@ def run_planner(
             raise ValueError(f"Planner selected invalid specialty IDs: {invalid_ids}")
 
     # Validate scored catalog
-    scored_ids = [s.specialty_id for s in planner_result.scored_catalog]
-    is_valid_scored, invalid_scored = validate_specialty_ids(scored_ids)
-    if not is_valid_scored:
+    invalid_scored = validate_specialty_ids_batch(s.specialty_id for s in planner_result.scored_catalog)
+    if invalid_scored:
         # Filter out invalid entries (safety fallback)
         planner_result.scored_catalog = [
             s for s in planner_result.scored_catalog
@@ -131,13 +150,10 @@ def _retry_planner_with_correction(
     llm_client: LLMClient,
     config: Config,
     original_response: str,
-    invalid_ids: list[str],
-    valid_ids: list[str]
+    invalid_ids: list[str]
 ) -> tuple[PlannerResult, LLMResponse]:
     """Retry planner call with correction for invalid specialty IDs."""
 
-    catalog = get_catalog()
-
     correction_prompt = f"""CRITICAL ERROR: Your previous response used INVALID specialty IDs.
 
 [ERROR] INVALID IDs YOU USED: {', '.join(invalid_ids)}
@@ -145,7 +161,7 @@ def _retry_planner_with_correction(
 These specialty IDs DO NOT EXIST in our catalog. They will cause the system to FAIL.
 
 [VALID] COMPLETE LIST OF VALID SPECIALTY IDs (use ONLY these):
-{chr(10).join(f"  - {sid}" for sid in valid_ids)}
+{_valid_ids_block()}
 
 INSTRUCTIONS:
 1. Do NOT use "{', '.join(invalid_ids)}" - these are INVALID
@@ -156,8 +172,10 @@ INSTRUCTIONS:
 
 Provide a CORRECTED response now with ONLY valid specialty IDs from the list above:"""
 
-    temp = config.agent_temperatures.planner if config.agent_temperatures.planner is not None else config.temperature
-    response = llm_client.complete(correction_prompt, max_tokens=2500, temperature=temp)
+    temp = _planner_temperature(config)
+    response = llm_client.complete(
+        correction_prompt, max_tokens=2500, temperature=temp, response_format="json"
+    )
 
     try:
         result_dict = _extract_json(response.content)
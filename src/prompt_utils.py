@@ -0,0 +1,44 @@
+"""
+Utility functions for loading and rendering agent prompt templates.
+"""
+
+from functools import cache
+from pathlib import Path
+from string import Formatter
+
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+class PromptTemplate:
+    """
+    A str.format-style prompt template parsed once up front.
+
+    Rendering joins the pre-split literal chunks with the field values,
+    producing the same text as template.format(**fields) without
+    re-parsing the template on every call.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        parts = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in prompt field: {{{field}}}")
+            parts.append((literal, field))
+        self._parts: tuple[tuple[str, str | None], ...] = tuple(parts)
+
+    def render(self, **fields) -> str:
+        """Fill in the template fields (values are converted with str())."""
+        return "".join(
+            literal if field is None else literal + str(fields[field])
+            for literal, field in self._parts
+        )
+
+
+@cache
+def load_prompt_template(name: str) -> PromptTemplate:
+    """Load and parse a prompt template from the prompts directory (cached)."""
+    prompt_path = PROMPTS_DIR / name
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return PromptTemplate(f.read())
@@ -4,9 +4,23 @@ Ensures system operates within safe boundaries.
 """
 
 import re
+import threading
+from functools import lru_cache
 from typing import Optional
 
-from .catalog import validate_specialty_ids, get_specialty_ids
+try:
+    # Optional (pip install google-re2): linear-time matching without backtracking
+    import re2 as _phi_re
+except ImportError:
+    _phi_re = re
+
+try:
+    # Optional (pip install hyperscan): SIMD multi-pattern scanning in a single pass
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+from .catalog import get_specialty_id_set
 from .config import Config
 from .schemas import PlannerResult, SpecialistReport, FinalDecision
 
@@ -24,6 +38,86 @@ DISCLAIMER = """
 """
 
 
+# PHI detectors (very basic heuristics).
+# Note: the date pattern deliberately allows "65-year-old" style mentions.
+_PHI_PATTERN_SOURCES: list[tuple[str, str]] = [
+    # SSN pattern
+    (r'\b\d{3}-\d{2}-\d{4}\b', "Possible SSN detected"),
+    # MRN pattern (varies, but often numeric)
+    (r'\b[Mm][Rr][Nn]\s*:?\s*\d+', "Possible MRN detected"),
+    # Email addresses
+    (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', "Email address detected"),
+    # Phone numbers
+    (r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', "Possible phone number detected"),
+    # Dates in specific formats (MM/DD/YYYY, etc.)
+    (r'\b\d{1,2}/\d{1,2}/\d{4}\b', "Specific date detected (possible DOB)"),
+]
+
+
+def _compile_phi_pattern(source: str):
+    """
+    Compile a PHI detector with ASCII semantics for \\d, \\w and \\b.
+
+    RE2 and Hyperscan only support ASCII classes, so the stdlib fallback is
+    compiled with re.ASCII to flag exactly the same texts whichever engine
+    is installed.
+    """
+    if _phi_re is re:
+        return re.compile(source, re.ASCII)
+    return _phi_re.compile(source)
+
+
+# Compiled once at import
+_PHI_PATTERNS = [(_compile_phi_pattern(source), message) for source, message in _PHI_PATTERN_SOURCES]
+
+# All detectors fused into one alternation, so clean text is scanned in a single pass.
+# Matches consume text, so a hit on one detector can hide an overlapping hit on
+# another; texts that match are therefore re-checked per detector for the warnings.
+_PHI_COMBINED = _compile_phi_pattern("|".join(f"(?:{source})" for source, _ in _PHI_PATTERN_SOURCES))
+
+# Longest input scanned for PHI; anything past this is not scanned. Bounds the
+# worst-case regex time (and the size of the memoized texts) on bulk input.
+MAX_PHI_INPUT_CHARS = 65_536
+
+# Every detector except the email one requires a digit, so digit-free text
+# (the common case for clinical vignettes) only needs the digit-free detectors.
+_PHI_DIGIT = _compile_phi_pattern(r'\d')
+_PHI_NO_DIGIT_PATTERNS = [
+    (pattern, message)
+    for (pattern, message), (source, _) in zip(_PHI_PATTERNS, _PHI_PATTERN_SOURCES)
+    if r'\d' not in source
+]
+
+
+def _compile_phi_database():
+    """
+    Compile all PHI detectors into one Hyperscan database.
+
+    Returns None if Hyperscan is not installed or cannot compile the
+    detectors (e.g. unsupported CPU), so scanning falls back to re2/re.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[source.encode() for source, _ in _PHI_PATTERN_SOURCES],
+            ids=list(range(len(_PHI_PATTERN_SOURCES))),
+            elements=len(_PHI_PATTERN_SOURCES),
+            # Report each detector at most once; overlapping hits are all reported
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_PHI_PATTERN_SOURCES),
+        )
+    except hyperscan.error as e:
+        print(f"WARNING: Hyperscan unavailable for PHI scanning, using regex fallback: {e}")
+        return None
+    return database
+
+
+_PHI_DATABASE = _compile_phi_database()
+# The database's scratch space is not safe for concurrent scans
+_PHI_DATABASE_LOCK = threading.Lock()
+
+
 def print_disclaimer():
     """Print the educational use disclaimer."""
     print(DISCLAIMER)
@@ -41,16 +135,28 @@ def validate_planner_output(result: PlannerResult, config: Config) -> tuple[bool
         (is_valid, warnings) tuple
     """
     warnings = []
+    valid_ids = get_specialty_id_set()
 
     # Check specialty IDs are from catalog
-    is_valid, invalid_ids = validate_specialty_ids(result.selected_specialties)
-    if not is_valid:
+    invalid_ids = [sid for sid in result.selected_specialties if sid not in valid_ids]
+    if invalid_ids:
         warnings.append(f"Invalid specialty IDs selected: {invalid_ids}")
 
-    # Check scored catalog contains valid IDs
-    scored_ids = [s.specialty_id for s in result.scored_catalog]
-    is_valid_scored, invalid_scored = validate_specialty_ids(scored_ids)
-    if not is_valid_scored:
+    # Check scored catalog IDs and score validity in a single pass
+    invalid_scored = []
+    score_warnings = []
+    for scored in result.scored_catalog:
+        sid = scored.specialty_id
+        relevance = scored.relevance
+        coverage_gain = scored.coverage_gain
+        if sid not in valid_ids:
+            invalid_scored.append(sid)
+        if not (0.0 <= relevance <= 1.0):
+            score_warnings.append(f"Relevance score out of range for {sid}: {relevance}")
+        if not (0.0 <= coverage_gain <= 1.0):
+            score_warnings.append(f"Coverage gain out of range for {sid}: {coverage_gain}")
+
+    if invalid_scored:
         warnings.append(f"Invalid specialty IDs in scored catalog: {invalid_scored}")
 
     # Check selection count
@@ -60,12 +166,7 @@ def validate_planner_output(result: PlannerResult, config: Config) -> tuple[bool
             f"> {config.budgets.max_specialists}"
         )
 
-    # Check for score validity
-    for scored in result.scored_catalog:
-        if not (0.0 <= scored.relevance <= 1.0):
-            warnings.append(f"Relevance score out of range for {scored.specialty_id}: {scored.relevance}")
-        if not (0.0 <= scored.coverage_gain <= 1.0):
-            warnings.append(f"Coverage gain out of range for {scored.specialty_id}: {scored.coverage_gain}")
+    warnings.extend(score_warnings)
 
     return len(warnings) == 0, warnings
 
@@ -83,7 +184,7 @@ def validate_specialist_output(report: SpecialistReport) -> tuple[bool, list[str
     warnings = []
 
     # Check specialty ID is valid
-    valid_ids = set(get_specialty_ids())
+    valid_ids = get_specialty_id_set()
     if report.specialty_id not in valid_ids:
         warnings.append(f"Invalid specialty ID: {report.specialty_id}")
 
@@ -91,14 +192,19 @@ def validate_specialist_output(report: SpecialistReport) -> tuple[bool, list[str
     if len(report.differential) > 3:
         warnings.append(f"Too many diagnoses in differential: {len(report.differential)} > 3")
 
-    # Check probabilities
-    total_p = sum(item.p for item in report.differential)
+    # Check probabilities: sum and per-item range in a single pass
+    total_p = 0.0
+    range_warnings = []
+    for item in report.differential:
+        p = item.p
+        total_p += p
+        if not (0.0 <= p <= 1.0):
+            range_warnings.append(f"Probability out of range for {item.dx}: {p}")
+
     if total_p > 1.01:  # Small tolerance
         warnings.append(f"Probabilities sum to {total_p:.2f} > 1.0")
 
-    for item in report.differential:
-        if not (0.0 <= item.p <= 1.0):
-            warnings.append(f"Probability out of range for {item.dx}: {item.p}")
+    warnings.extend(range_warnings)
 
     return len(warnings) == 0, warnings
 
@@ -131,37 +237,69 @@ def check_for_phi(text: str) -> tuple[bool, list[str]]:
     """
     Check for potential PHI in text (basic heuristic).
 
+    Only the first MAX_PHI_INPUT_CHARS characters are scanned; longer
+    input gets an extra "Input truncated for PHI scan" warning, which does
+    not by itself count as PHI.
+
     Args:
         text: Text to check
 
     Returns:
         (has_phi, warnings) tuple
     """
-    warnings = []
+    warnings = list(_scan_phi(text[:MAX_PHI_INPUT_CHARS]))
+    has_phi = len(warnings) > 0
+    if len(text) > MAX_PHI_INPUT_CHARS:
+        warnings.append("Input truncated for PHI scan")
+    return has_phi, warnings
 
-    # Check for common PHI patterns (very basic)
-    # SSN pattern
-    if re.search(r'\b\d{3}-\d{2}-\d{4}\b', text):
-        warnings.append("Possible SSN detected")
 
-    # MRN pattern (varies, but often numeric)
-    if re.search(r'\b[Mm][Rr][Nn]\s*:?\s*\d+', text):
-        warnings.append("Possible MRN detected")
+def has_phi_fast(text: str) -> bool:
+    """
+    Check whether text may contain PHI, without identifying which kind.
 
-    # Email addresses
-    if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
-        warnings.append("Email address detected")
+    Stops at the first match, so it is cheaper than check_for_phi()
+    when only a yes/no answer is needed. Scans the same
+    MAX_PHI_INPUT_CHARS prefix as check_for_phi().
 
-    # Phone numbers
-    if re.search(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', text):
-        warnings.append("Possible phone number detected")
+    Args:
+        text: Text to check
 
-    # Dates in specific formats (MM/DD/YYYY, etc.)
-    # Note: We allow "65-year-old" style mentions
-    if re.search(r'\b\d{1,2}/\d{1,2}/\d{4}\b', text):
-        warnings.append("Specific date detected (possible DOB)")
+    Returns:
+        True if any PHI pattern matches
+    """
+    text = text[:MAX_PHI_INPUT_CHARS]
+    if not _PHI_DIGIT.search(text):
+        return any(pattern.search(text) for pattern, _ in _PHI_NO_DIGIT_PATTERNS)
+    return _PHI_COMBINED.search(text) is not None
+
+
+@lru_cache(maxsize=1024)
+def _scan_phi(text: str) -> tuple[str, ...]:
+    """
+    PHI warnings for `text`, memoized on the text itself.
+
+    The same question is re-checked across baselines, debate rounds and
+    retries; repeats are served from the cache instead of re-scanning.
+    """
+    if _PHI_DATABASE is not None:
+        hits: set[int] = set()
+        with _PHI_DATABASE_LOCK:
+            _PHI_DATABASE.scan(
+                text.encode("utf-8"),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id),
+            )
+        return tuple(
+            message for i, (_, message) in enumerate(_PHI_PATTERN_SOURCES) if i in hits
+        )
+
+    if not _PHI_DIGIT.search(text):
+        return tuple(message for pattern, message in _PHI_NO_DIGIT_PATTERNS if pattern.search(text))
+
+    if not _PHI_COMBINED.search(text):
+        return ()
 
-    return len(warnings) > 0, warnings
+    return tuple(message for pattern, message in _PHI_PATTERNS if pattern.search(text))
 
 
 def sanitize_specialty_ids(specialty_ids: list[str]) -> list[str]:
@@ -174,7 +312,7 @@ def sanitize_specialty_ids(specialty_ids: list[str]) -> list[str]:
     Returns:
         Sanitized list with only valid IDs
     """
-    valid_ids = set(get_specialty_ids())
+    valid_ids = get_specialty_id_set()
     return [sid for sid in specialty_ids if sid in valid_ids]
 
 
@@ -183,7 +321,9 @@ def apply_safety_checks(
     planner_result: Optional[PlannerResult] = None,
     specialist_reports: Optional[list[SpecialistReport]] = None,
     final_decision: Optional[FinalDecision] = None,
-    config: Optional[Config] = None
+    config: Optional[Config] = None,
+    phi_detail: bool = True,
+    fail_fast: bool = False
 ) -> list[str]:
     """
     Apply comprehensive safety checks.
@@ -194,6 +334,11 @@ def apply_safety_checks(
         specialist_reports: Optional specialist reports
         final_decision: Optional final decision
         config: Optional config
+        phi_detail: If False, PHI in the input is reported as a single
+            generic "[INPUT] Possible PHI detected" warning (first match
+            only) instead of one warning per PHI type
+        fail_fast: If True, return as soon as a check stage produces
+            warnings (for pass/fail decisions; later stages are skipped)
 
     Returns:
         List of warnings
@@ -201,15 +346,27 @@ def apply_safety_checks(
     all_warnings = []
 
     # Check for PHI in input
-    has_phi, phi_warnings = check_for_phi(question)
-    if has_phi:
-        all_warnings.extend([f"[INPUT] {w}" for w in phi_warnings])
+    if phi_detail:
+        _, phi_warnings = check_for_phi(question)
+        if phi_warnings:
+            all_warnings.extend([f"[INPUT] {w}" for w in phi_warnings])
+    else:
+        if has_phi_fast(question):
+            all_warnings.append("[INPUT] Possible PHI detected")
+        # Same truncation notice as the detailed path, so the summary is not quieter
+        if len(question) > MAX_PHI_INPUT_CHARS:
+            all_warnings.append("[INPUT] Input truncated for PHI scan")
+
+    if fail_fast and all_warnings:
+        return all_warnings
 
     # Validate planner
     if planner_result and config:
         is_valid, warnings = validate_planner_output(planner_result, config)
         if not is_valid:
             all_warnings.extend([f"[PLANNER] {w}" for w in warnings])
+            if fail_fast:
+                return all_warnings
 
     # Validate specialists
     if specialist_reports:
@@ -217,6 +374,8 @@ def apply_safety_checks(
             is_valid, warnings = validate_specialist_output(report)
             if not is_valid:
                 all_warnings.extend([f"[SPECIALIST:{report.specialty_id}] {w}" for w in warnings])
+                if fail_fast:
+                    return all_warnings
 
     # Validate aggregator
     if final_decision:
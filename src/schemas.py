@@ -41,15 +41,6 @@ class PlannerResult(BaseModel):
     )
     rationale: str = Field(default="", description="Overall planning rationale")
 
-    @field_validator('selected_specialties')
-    @classmethod
-    def validate_selected_count(cls, v):
-        if len(v) > 5:
-            raise ValueError("Cannot select more than 5 specialties")
-        if len(v) == 0:
-            raise ValueError("Must select at least 1 specialty")
-        return v
-
 
 # ============================================================================
 # Specialist Schemas
@@ -88,10 +79,9 @@ class SpecialistReport(BaseModel):
     @field_validator('differential')
     @classmethod
     def validate_differential(cls, v):
+        # The max_length=3 bound is enforced by pydantic-core before this runs
         if len(v) == 0:
             raise ValueError("Differential must contain at least one diagnosis")
-        if len(v) > 3:
-            raise ValueError("Differential cannot contain more than 3 diagnoses")
 
         # Check that probabilities sum to <= 1.0
         total_p = sum(item.p for item in v)
@@ -100,6 +90,11 @@ class SpecialistReport(BaseModel):
 
         return v
 
+    @property
+    def total_probability(self) -> float:
+        """Sum of the differential probabilities (not serialized)."""
+        return sum(item.p for item in self.differential)
+
 
 # ============================================================================
 # Aggregator Schemas
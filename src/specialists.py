@@ -3,20 +3,20 @@ Specialist agents: produce differential diagnoses from specific specialty perspe
 """
 
 import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 from .catalog import get_specialty_by_id
 from .config import Config
 from .llm_client import LLMClient, LLMResponse
+from .prompt_utils import load_prompt_template
 from .schemas import SpecialistReport, PlannerResult
 
 
 def load_specialist_prompt() -> str:
     """Load the specialist prompt template."""
-    prompt_path = Path(__file__).parent / "prompts" / "specialist.txt"
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return load_prompt_template("specialist.txt").template
 
 
 def run_specialist(
@@ -48,9 +48,8 @@ def run_specialist(
     if not specialty:
         raise ValueError(f"Invalid specialty ID: {specialty_id}")
 
-    # Format prompt
-    prompt_template = load_specialist_prompt()
-    prompt = prompt_template.format(
+    # Format prompt (template is read and parsed once, then cached)
+    prompt = load_prompt_template("specialist.txt").render(
         specialty_display_name=specialty.display_name,
         specialty_id=specialty_id,
         question=question,
@@ -65,8 +64,7 @@ def run_specialist(
 
     # Parse JSON response
     try:
-        result_dict = _extract_json(response.content)
-        specialist_report = SpecialistReport(**result_dict)
+        specialist_report = _parse_report(response.content, SpecialistReport)
     except (json.JSONDecodeError, ValueError) as e:
         if retry and config.budgets.max_retries > 0:
             # Retry with fix-JSON instruction
@@ -104,6 +102,10 @@ def run_specialists(
     """
     Run multiple specialist consultations.
 
+    Consultations are independent and I/O-bound, so they run concurrently
+    (at most config.safety.max_concurrent_calls at a time). Results keep
+    the order of selected_specialties.
+
     Args:
         selected_specialties: List of specialty IDs
         question: Clinical question
@@ -117,17 +119,28 @@ def run_specialists(
     """
     results = []
 
-    for specialty_id in selected_specialties:
+    def consult(specialty_id: str) -> tuple[SpecialistReport, LLMResponse]:
+        return run_specialist(
+            specialty_id=specialty_id,
+            question=question,
+            options=options,
+            planner_result=planner_result,
+            llm_client=llm_client,
+            config=config
+        )
+
+    max_workers = min(len(selected_specialties), config.safety.max_concurrent_calls)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(sid, executor.submit(consult, sid)) for sid in selected_specialties]
+        outcomes = [(sid, future.result) for sid, future in futures]
+    else:
+        # Nothing to overlap: run inline rather than through a one-thread pool
+        outcomes = [(sid, partial(consult, sid)) for sid in selected_specialties]
+
+    for specialty_id, get_result in outcomes:
         try:
-            report, response = run_specialist(
-                specialty_id=specialty_id,
-                question=question,
-                options=options,
-                planner_result=planner_result,
-                llm_client=llm_client,
-                config=config
-            )
-            results.append((report, response))
+            results.append(get_result())
         except Exception as e:
             # Log error but continue with other specialists
             print(f"Error running specialist {specialty_id}: {e}")
@@ -184,8 +197,7 @@ Ensure:
     response = llm_client.complete(fix_prompt, temperature=temp)
 
     try:
-        result_dict = _extract_json(response.content)
-        specialist_report = SpecialistReport(**result_dict)
+        specialist_report = _parse_report(response.content, SpecialistReport)
         specialist_report.specialty_id = specialty_id  # Ensure correct ID
         return specialist_report, response
     except (json.JSONDecodeError, ValueError) as e:
@@ -195,5 +207,5 @@ Ensure:
         )
 
 
-# Import shared JSON extraction utility
-from .json_utils import extract_json_from_llm_response as _extract_json
+# Import shared JSON parsing utility
+from .json_utils import parse_llm_response_as as _parse_report
@@ -0,0 +1,65 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from src.config import (
+    AgentTemperatureConfig,
+    BudgetConfig,
+    Config,
+    LoggingConfig,
+    PlannerConfig,
+    SafetyConfig,
+    VLLMConfig,
+)
+from src.llm_client import MockLLMClient
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-e2e",
+        action="store_true",
+        default=False,
+        help="also run end-to-end tests (marked e2e)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip e2e-marked tests unless --run-e2e is given."""
+    if config.getoption("--run-e2e"):
+        return
+    skip_e2e = pytest.mark.skip(reason="end-to-end test; use --run-e2e to run")
+    for item in items:
+        if "e2e" in item.keywords:
+            item.add_marker(skip_e2e)
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """
+    Create a mock configuration (shared; treat as read-only).
+
+    Built with model_construct: the values are known-good, and bypassing
+    BaseSettings keeps a local .env or environment variables from leaking
+    into the tests. The sub-configs are BaseSettings too (their default
+    factories would read the environment), so each is constructed explicitly.
+    """
+    return Config.model_construct(
+        provider="mock",
+        model="mock-model",
+        temperature=0.3,
+        max_output_tokens=800,
+        budgets=BudgetConfig.model_construct(),
+        planner=PlannerConfig.model_construct(),
+        logging=LoggingConfig.model_construct(),
+        safety=SafetyConfig.model_construct(),
+        agent_temperatures=AgentTemperatureConfig.model_construct(),
+        vllm=VLLMConfig.model_construct(),
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_llm_client(mock_config):
+    """Create a mock LLM client (shared; responses are stateless)."""
+    return MockLLMClient(mock_config)
@@ -5,43 +5,25 @@ Tests for aggregator agent.
 import pytest
 
 from src.aggregator import run_aggregator
-from src.config import Config
-from src.llm_client import MockLLMClient
 from src.schemas import SpecialistReport, DifferentialItem
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    return Config(
-        provider="mock",
-        model="mock-model",
-        temperature=0.3,
-        max_output_tokens=800,
-    )
-
-
-@pytest.fixture
-def mock_llm_client(mock_config):
-    """Create a mock LLM client."""
-    return MockLLMClient(mock_config)
-
-
 @pytest.fixture
 def mock_specialist_reports():
     """Create mock specialist reports."""
+    # Known-good literals, so validation is skipped
     return [
-        SpecialistReport(
+        SpecialistReport.model_construct(
             specialty_id="cardiology",
             differential=[
-                DifferentialItem(
+                DifferentialItem.model_construct(
                     dx="Acute Myocardial Infarction",
                     p=0.7,
                     evidence_for=["chest pain", "radiation to arm"],
                     evidence_against=[],
                     discriminators=["ECG", "troponin"]
                 ),
-                DifferentialItem(
+                DifferentialItem.model_construct(
                     dx="Unstable Angina",
                     p=0.2,
                     evidence_for=["chest pain"],
@@ -51,10 +33,10 @@ def mock_specialist_reports():
             ],
             notes="Consider immediate catheterization"
         ),
-        SpecialistReport(
+        SpecialistReport.model_construct(
             specialty_id="pulmonology",
             differential=[
-                DifferentialItem(
+                DifferentialItem.model_construct(
                     dx="Pulmonary Embolism",
                     p=0.3,
                     evidence_for=["chest pain"],
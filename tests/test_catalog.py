@@ -3,12 +3,15 @@ Tests for specialty catalog.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from src.catalog import (
     get_catalog,
     get_specialty_by_id,
     get_specialty_ids,
+    get_specialty_id_set,
     validate_specialty_ids,
+    validate_specialty_ids_batch,
     get_generalist_ids,
 )
 
@@ -34,6 +37,16 @@ def test_catalog_integrity():
         assert 0.0 <= spec.procedural_signal <= 1.0
 
 
+def test_specialty_is_frozen_and_hashable():
+    """Test that catalog entries cannot be mutated and can be used as dict keys."""
+    cardiology = get_specialty_by_id("cardiology")
+
+    with pytest.raises(ValidationError):
+        cardiology.emergency_weight = 0.0
+
+    assert {spec: spec.id for spec in get_catalog()}[cardiology] == "cardiology"
+
+
 def test_get_specialty_by_id():
     """Test specialty lookup by ID."""
     # Valid ID
@@ -46,6 +59,10 @@ def test_get_specialty_by_id():
     invalid = get_specialty_by_id("nonexistent_specialty")
     assert invalid is None
 
+    # Every catalog entry is reachable and returned as the same object
+    for spec in get_catalog():
+        assert get_specialty_by_id(spec.id) is spec
+
 
 def test_get_specialty_ids():
     """Test getting all specialty IDs."""
@@ -57,6 +74,15 @@ def test_get_specialty_ids():
     assert "neurology" in ids
 
 
+def test_get_specialty_id_set():
+    """Test that the cached ID set mirrors the catalog."""
+    id_set = get_specialty_id_set()
+
+    assert isinstance(id_set, frozenset)
+    assert id_set == set(get_specialty_ids())
+    assert get_specialty_id_set() is id_set
+
+
 def test_validate_specialty_ids():
     """Test specialty ID validation."""
     # Valid IDs
@@ -77,22 +103,28 @@ def test_validate_specialty_ids():
     assert "fake2" in invalid
 
 
+def test_validate_specialty_ids_batch():
+    """Test batch validation returns the set of invalid IDs."""
+    assert validate_specialty_ids_batch(["cardiology", "neurology"]) == set()
+
+    ids = (sid for sid in ["cardiology", "fake1", "fake1", "fake2"])
+    assert validate_specialty_ids_batch(ids) == {"fake1", "fake2"}
+
+
 def test_get_generalist_ids():
     """Test getting generalist specialty IDs."""
     generalist_ids = get_generalist_ids()
 
-    assert len(generalist_ids) == 3
-    assert "emergency_medicine" in generalist_ids
-    assert "pediatrics" in generalist_ids
-    assert "family_internal_medicine" in generalist_ids
+    assert generalist_ids == {"emergency_medicine", "pediatrics", "family_internal_medicine"}
+    assert get_generalist_ids() is generalist_ids
 
 
 def test_catalog_coverage():
     """Test that catalog has expected specialties."""
-    ids = get_specialty_ids()
+    ids = get_specialty_id_set()
 
     # Check for key specialties
-    expected = [
+    expected = {
         "emergency_medicine",
         "pediatrics",
         "family_internal_medicine",
@@ -102,7 +134,7 @@ def test_catalog_coverage():
         "gastroenterology",
         "general_surgery",
         "orthopedic_surgery",
-    ]
+    }
 
-    for spec_id in expected:
-        assert spec_id in ids, f"Expected specialty {spec_id} not in catalog"
+    missing = expected - ids
+    assert not missing, f"Expected specialties not in catalog: {sorted(missing)}"
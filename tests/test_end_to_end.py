@@ -4,26 +4,21 @@ End-to-end integration tests.
 
 import pytest
 
-from src.config import Config
-from src.llm_client import MockLLMClient
 from src.orchestration import run_case
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    return Config(
-        provider="mock",
-        model="mock-model",
-        temperature=0.3,
-        max_output_tokens=800,
-    )
+pytestmark = pytest.mark.e2e
 
 
-@pytest.fixture
-def mock_llm_client(mock_config):
-    """Create a mock LLM client."""
-    return MockLLMClient(mock_config)
+@pytest.fixture(scope="module")
+def generic_case_result(mock_config, mock_llm_client):
+    """Run the generic "Test question" case once for every test that inspects it."""
+    return run_case(
+        question="Test question",
+        options=None,
+        config=mock_config,
+        llm_client=mock_llm_client
+    )
 
 
 def test_run_case_complete(mock_config, mock_llm_client):
@@ -88,16 +83,9 @@ def test_run_case_without_options(mock_config, mock_llm_client):
     assert trace.is_correct is None
 
 
-def test_run_case_respects_budgets(mock_config, mock_llm_client):
+def test_run_case_respects_budgets(mock_config, generic_case_result):
     """Test that case execution respects budget limits."""
-    question = "Test question"
-
-    final_decision, trace = run_case(
-        question=question,
-        options=None,
-        config=mock_config,
-        llm_client=mock_llm_client
-    )
+    final_decision, trace = generic_case_result
 
     # Count total agents: planner + specialists + aggregator
     total_agents = 1 + len(trace.specialist_traces) + 1
@@ -105,16 +93,9 @@ def test_run_case_respects_budgets(mock_config, mock_llm_client):
     assert total_agents <= mock_config.budgets.max_agents_total
 
 
-def test_run_case_json_validity(mock_config, mock_llm_client):
+def test_run_case_json_validity(generic_case_result):
     """Test that all outputs are valid JSON-serializable."""
-    question = "Test question"
-
-    final_decision, trace = run_case(
-        question=question,
-        options=None,
-        config=mock_config,
-        llm_client=mock_llm_client
-    )
+    final_decision, trace = generic_case_result
 
     # Should be able to serialize to dict
     trace_dict = trace.model_dump()
@@ -0,0 +1,58 @@
+"""
+Tests for JSON parsing of LLM responses.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.json_utils import extract_json_from_llm_response, parse_llm_response_as
+from src.schemas import SpecialistReport
+
+
+REPORT = {
+    "specialty_id": "cardiology",
+    "differential": [{"dx": "Acute MI", "p": 0.7}],
+    "notes": "See https://example.org // not a comment",
+}
+
+
+def test_extract_json_from_fenced_response():
+    """Test that code fences and preamble text are stripped."""
+    text = "Here is the output:\n```json\n" + json.dumps({"a": 1}) + "\n```"
+    assert extract_json_from_llm_response(text) == {"a": 1}
+
+
+def test_parse_llm_response_as_clean_json():
+    """Test that bare JSON is validated straight into the model."""
+    report = parse_llm_response_as(json.dumps(REPORT), SpecialistReport)
+
+    assert isinstance(report, SpecialistReport)
+    assert report.differential[0].dx == "Acute MI"
+    assert report.notes == REPORT["notes"]
+
+
+def test_parse_llm_response_as_falls_back_for_messy_json():
+    """Test that fenced or commented JSON goes through the cleanup path."""
+    text = (
+        "```json\n{\"specialty_id\": \"cardiology\", // the specialty\n"
+        "\"differential\": [{\"dx\": \"Acute MI\", \"p\": 0.7}]}\n```"
+    )
+    report = parse_llm_response_as(text, SpecialistReport)
+
+    assert report.specialty_id == "cardiology"
+
+
+def test_parse_llm_response_as_schema_error():
+    """Test that schema violations raise a ValidationError."""
+    bad = dict(REPORT, differential=[])
+
+    with pytest.raises(ValidationError, match="at least one diagnosis"):
+        parse_llm_response_as(json.dumps(bad), SpecialistReport)
+
+
+def test_extract_json_invalid_raises_json_decode_error():
+    """Test that unparseable responses still raise json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        extract_json_from_llm_response("no json here")
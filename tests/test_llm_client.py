@@ -0,0 +1,71 @@
+"""
+Tests for the LLM clients.
+"""
+
+import dataclasses
+import json
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from src.llm_client import (
+    _MOCK_AGGREGATOR_JSON,
+    _MOCK_PLANNER_JSON,
+    _MOCK_SPECIALIST_JSON,
+    OpenAIClient,
+)
+from src.schemas import FinalDecision, PlannerResult, SpecialistReport
+
+
+@pytest.mark.parametrize("payload, model", [
+    (_MOCK_PLANNER_JSON, PlannerResult),
+    (_MOCK_SPECIALIST_JSON, SpecialistReport),
+    (_MOCK_AGGREGATOR_JSON, FinalDecision),
+])
+def test_canned_payloads_match_schemas(payload, model):
+    """Test that the pre-serialized mock payloads validate against their schemas."""
+    assert isinstance(payload, str)
+    model.model_validate_json(payload)
+
+
+def test_mock_responses_are_shared_and_immutable(mock_llm_client):
+    """Test that repeated calls return the same pre-built, frozen response."""
+    prompt = "You are the Clinical Generalist Planner."
+    first = mock_llm_client.complete(prompt)
+    second = mock_llm_client.complete(prompt)
+
+    assert first is second
+    assert first.content is _MOCK_PLANNER_JSON
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.content = "{}"
+
+
+def test_openai_json_response_format_payload(mock_config):
+    """Test that OpenAI requests JSON mode only when response_format="json" is given."""
+    payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "mock-model",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "{}"},
+            }],
+        })
+
+    config = mock_config.model_copy(update={"provider": "openai", "openai_api_key": "test-key"})
+    client = OpenAIClient(config)
+    client.client = OpenAI(api_key="test-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    client.complete("Hello", response_format="json")
+    client.complete("Hello")
+
+    with_json, without_json = payloads
+    assert with_json["response_format"] == {"type": "json_object"}
+    assert "response_format" not in without_json
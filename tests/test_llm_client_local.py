@@ -0,0 +1,91 @@
+"""
+Tests for the local LLM clients (Ollama, llama.cpp, vLLM).
+"""
+
+import json
+
+import httpx
+import pytest
+
+from src.config import VLLMConfig
+from src.llm_client_local import OllamaClient, VLLMClient
+
+
+_CHAT_RESPONSE = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "mock-model",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": "ok"},
+    }],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+}
+
+_RESPONSES = {
+    "/api/generate": {"response": "ok"},
+    "/v1/chat/completions": _CHAT_RESPONSE,
+    "/v1/completions": {"choices": [{"text": "ok"}]},
+}
+
+
+def _redirecting_transport():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.scheme == "http":
+            return httpx.Response(307, headers={"location": str(request.url.copy_with(scheme="https"))})
+        return httpx.Response(200, json=_CHAT_RESPONSE)
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def sent_payloads():
+    """MockTransport that answers every endpoint and records the JSON bodies sent."""
+    payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json=_RESPONSES[request.url.path])
+
+    return payloads, httpx.MockTransport(handler)
+
+
+def test_pooled_client_follows_redirects(mock_config, monkeypatch):
+    """Test that an http base_url redirected to https still succeeds."""
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        httpx, "Client", lambda **kwargs: real_client(transport=_redirecting_transport(), **kwargs)
+    )
+    client = VLLMClient(mock_config, base_url="http://vllm.example")
+
+    response = client.complete("Hello")
+
+    assert client._http.follow_redirects
+    assert response.content == "ok"
+
+
+@pytest.mark.parametrize("make_client, expected", [
+    (lambda config: OllamaClient(config), {"format": "json"}),
+    (lambda config: VLLMClient(config), {"response_format": {"type": "json_object"}}),
+    (
+        lambda config: VLLMClient(
+            config.model_copy(update={"vllm": VLLMConfig.model_construct(use_chat_api=False)})
+        ),
+        {},
+    ),
+])
+def test_json_response_format_payload(mock_config, monkeypatch, sent_payloads, make_client, expected):
+    """Test how each local provider maps response_format="json" onto its request payload."""
+    payloads, transport = sent_payloads
+    real_client = httpx.Client
+    monkeypatch.setattr(httpx, "Client", lambda **kwargs: real_client(transport=transport, **kwargs))
+    client = make_client(mock_config)
+
+    client.complete("Hello", response_format="json")
+    client.complete("Hello")
+
+    with_json, without_json = payloads
+    assert {k: with_json[k] for k in with_json.keys() - without_json.keys()} == expected
+    assert "format" not in without_json and "response_format" not in without_json
+
@@ -0,0 +1,48 @@
+"""
+Tests for trace logging utilities.
+"""
+
+import logging
+
+from src.config import Config, LoggingConfig
+from src.logging_utils import BackgroundFileWriter, JSONLTraceWriter, serialize_trace
+from src.orchestration import run_case
+from src.schemas import CaseTrace
+
+
+def test_jsonl_writer_uses_shared_serialization(tmp_path, mock_config, mock_llm_client):
+    """Test that JSONL traces are single-line records identical to serialize_trace()."""
+    _, trace = run_case("Test question", config=mock_config, llm_client=mock_llm_client)
+    config = Config.model_construct(logging=LoggingConfig.model_construct(traces_dir=str(tmp_path)))
+
+    output_file = JSONLTraceWriter(config).write_trace(trace)
+
+    with open(output_file, "rb") as f:
+        data = f.read()
+    assert data == serialize_trace(trace)
+    assert data.count(b"\n") == 1
+    assert CaseTrace.model_validate_json(data) == trace
+
+
+def test_background_writer_flushes_on_exit(tmp_path):
+    """Test that every submitted file is written by the time the with block exits."""
+    files = {tmp_path / f"trace_{i}.jsonl": f"record {i}\n".encode() for i in range(10)}
+
+    with BackgroundFileWriter() as writer:
+        for path, data in files.items():
+            writer.submit(path, data)
+
+    for path, data in files.items():
+        assert path.read_bytes() == data
+
+
+def test_background_writer_logs_failed_writes(tmp_path, caplog):
+    """Test that a failed write is logged instead of raised."""
+    missing = tmp_path / "missing_dir" / "trace.jsonl"
+
+    with caplog.at_level(logging.ERROR, logger="src.logging_utils"):
+        with BackgroundFileWriter() as writer:
+            writer.submit(missing, b"data")
+
+    assert not missing.exists()
+    assert "Background trace write failed" in caplog.text
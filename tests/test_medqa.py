@@ -0,0 +1,90 @@
+"""
+Tests for MedQA dataset loading.
+"""
+
+import json
+import random
+
+import pytest
+
+from src.medqa import MOCK_MEDQA_SAMPLE, load_medqa_subset
+
+
+RECORDS = [
+    {"question": f"Question {i}: which diagnosis fits best?", "options": ["A. X", "B. Y"], "answer": "A"}
+    for i in range(20)
+]
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    path = tmp_path / "medqa.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in RECORDS), encoding="utf-8")
+    return path
+
+
+def test_load_jsonl(jsonl_path):
+    """Test that JSONL files are parsed record by record."""
+    assert load_medqa_subset(jsonl_path, n=100, shuffle=False) == RECORDS
+
+
+def test_load_json_array(tmp_path):
+    """Test that JSON array files are parsed whole."""
+    path = tmp_path / "medqa.json"
+    path.write_text("\n  " + json.dumps(RECORDS, indent=2), encoding="utf-8")
+
+    assert load_medqa_subset(path, n=100, shuffle=False) == RECORDS
+
+
+@pytest.mark.parametrize("content", [
+    '{"question": "too short"}',
+    "404: Not Found" + " " * 200 + "page body",
+    "<html><body>" + "x" * 200 + "Not Found</body></html>",
+])
+def test_error_page_falls_back_to_mock(tmp_path, content):
+    """Test that tiny files and saved error pages fall back to the mock sample."""
+    path = tmp_path / "medqa.jsonl"
+    path.write_text(content, encoding="utf-8")
+
+    assert load_medqa_subset(path, n=100, shuffle=False) == MOCK_MEDQA_SAMPLE
+
+
+def test_json_content_mentioning_404_is_not_an_error_page(tmp_path):
+    """Test that files starting with '[' or '{' are not rejected for containing "404"."""
+    records = [dict(r, question=r["question"] + " Platelets 404 x10^9/L.") for r in RECORDS]
+    path = tmp_path / "medqa.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+    assert load_medqa_subset(path, n=100, shuffle=False) == records
+
+
+def test_unshuffled_load_stops_after_n(jsonl_path):
+    """Test that without shuffling exactly the first n records are returned."""
+    assert load_medqa_subset(jsonl_path, n=5, shuffle=False) == RECORDS[:5]
+
+
+def test_seeded_shuffle_matches_global_random_shuffle(jsonl_path):
+    """Test that the private RNG picks the same subset as seeding the global one."""
+    expected = list(RECORDS)
+    random.seed(7)
+    random.shuffle(expected)
+
+    assert load_medqa_subset(jsonl_path, n=5, seed=7) == expected[:5]
+
+
+def test_jsonl_skips_blank_comment_and_malformed_lines(tmp_path):
+    """Test that only valid JSON records survive the line pre-filter and parser."""
+    lines = [
+        "# MedQA export",
+        json.dumps(RECORDS[0]),
+        "",
+        "   ",
+        '{"question": "truncated record",',
+        json.dumps(RECORDS[1]),
+        "not json at all",
+        json.dumps(RECORDS[2]),
+    ]
+    path = tmp_path / "medqa.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert load_medqa_subset(path, n=100, shuffle=False) == RECORDS[:3]
@@ -0,0 +1,32 @@
+"""
+Tests for case orchestration and trace assembly.
+"""
+
+import pytest
+
+from src.orchestration import run_case
+from src.schemas import CaseTrace
+
+
+def test_trace_round_trips_through_json(mock_config, mock_llm_client):
+    """Test that a case trace written to disk validates when read back."""
+    _, trace = run_case(
+        question="Test question",
+        options=["A. GERD", "B. MI"],
+        correct_answer="B",
+        config=mock_config,
+        llm_client=mock_llm_client
+    )
+
+    assert CaseTrace.model_validate_json(trace.model_dump_json()) == trace
+
+
+def test_trace_rejects_invalid_caller_inputs(mock_config, mock_llm_client):
+    """Test that caller-supplied fields are validated when the trace is built."""
+    with pytest.raises(RuntimeError, match="validation error"):
+        run_case(
+            question="Test question",
+            options={"A": "GERD", "B": "MI"},
+            config=mock_config,
+            llm_client=mock_llm_client
+        )
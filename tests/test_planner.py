@@ -2,30 +2,10 @@
 Tests for planner agent.
 """
 
-import pytest
-
-from src.config import Config
-from src.llm_client import MockLLMClient
+from src.catalog import validate_specialty_ids
 from src.planner import run_planner
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    return Config(
-        provider="mock",
-        model="mock-model",
-        temperature=0.3,
-        max_output_tokens=800,
-    )
-
-
-@pytest.fixture
-def mock_llm_client(mock_config):
-    """Create a mock LLM client."""
-    return MockLLMClient(mock_config)
-
-
 def test_run_planner_basic(mock_llm_client, mock_config):
     """Test basic planner execution."""
     question = "A 65-year-old man with chest pain radiating to the left arm."
@@ -52,8 +32,6 @@ def test_run_planner_basic(mock_llm_client, mock_config):
 
 def test_planner_selects_valid_specialties(mock_llm_client, mock_config):
     """Test that planner only selects valid specialties."""
-    from src.catalog import validate_specialty_ids
-
     question = "Test question"
 
     planner_result, _ = run_planner(
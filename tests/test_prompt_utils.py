@@ -0,0 +1,46 @@
+"""
+Tests for prompt template utilities.
+"""
+
+import pytest
+
+from src.prompt_utils import PromptTemplate, load_prompt_template
+
+
+def test_render_matches_str_format():
+    """Test that rendering produces the same text as str.format."""
+    template = 'Case: {question}\nOptions: {options}\nJSON: {{"k": "{top_k}"}}'
+    fields = {"question": "A 3-year-old with stridor.", "options": ["A. Croup"], "top_k": 5}
+
+    assert PromptTemplate(template).render(**fields) == template.format(**fields)
+
+
+def test_render_requires_all_fields():
+    """Test that missing fields raise like str.format."""
+    with pytest.raises(KeyError):
+        PromptTemplate("{question} {options}").render(question="Q")
+
+
+def test_rejects_format_specs():
+    """Test that templates with format specs are rejected."""
+    with pytest.raises(ValueError, match="Unsupported"):
+        PromptTemplate("p={p:.2f}")
+
+
+def test_load_prompt_template_cached():
+    """Test that prompt files are loaded once."""
+    assert load_prompt_template("planner.txt") is load_prompt_template("planner.txt")
+
+
+def test_specialist_template_matches_str_format():
+    """Test that the specialist prompt renders exactly as with str.format."""
+    template = load_prompt_template("specialist.txt")
+    fields = {
+        "specialty_display_name": "Cardiology",
+        "specialty_id": "cardiology",
+        "question": "Chest pain with {braces} in the text.",
+        "options": ["A. GERD", "B. MI"],
+        "planner_rationale": "Cardiac symptoms",
+    }
+
+    assert template.render(**fields) == template.template.format(**fields)
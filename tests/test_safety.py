@@ -0,0 +1,248 @@
+"""
+Tests for safety guardrails.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+
+import pytest
+
+from src import safety
+from src.config import Config
+from src.safety import (
+    _PHI_NO_DIGIT_PATTERNS,
+    MAX_PHI_INPUT_CHARS,
+    apply_safety_checks,
+    check_for_phi,
+    has_phi_fast,
+    sanitize_specialty_ids,
+    validate_planner_output,
+    validate_specialist_output,
+)
+from src.schemas import DifferentialItem, PlannerResult, ScoredSpecialty, SpecialistReport
+
+
+def test_check_for_phi_clean_text():
+    """Test that ordinary case text raises no PHI warnings."""
+    has_phi, warnings = check_for_phi(
+        "A 65-year-old man presents with chest pain radiating to the left arm for 30 minutes."
+    )
+
+    assert not has_phi
+    assert warnings == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("SSN 123-45-6789 on file", "Possible SSN detected"),
+    ("MRN: 445566", "Possible MRN detected"),
+    ("Contact user@example.com", "Email address detected"),
+    ("Call 555-123-4567", "Possible phone number detected"),
+    ("Born 04/12/1987", "Specific date detected (possible DOB)"),
+])
+def test_check_for_phi_detects_patterns(text, expected):
+    """Test that each PHI pattern is detected."""
+    has_phi, warnings = check_for_phi(text)
+
+    assert has_phi
+    assert warnings == [expected]
+
+
+def test_check_for_phi_email_tld_is_letters_only():
+    """Test that the email TLD class no longer accepts a literal '|'."""
+    assert check_for_phi("reach me at user@example.com")[1] == ["Email address detected"]
+    assert check_for_phi("reach me at user@example.c|m")[1] == []
+
+
+def test_has_phi_fast():
+    """Test the boolean-only PHI check."""
+    assert has_phi_fast("Call 555-123-4567")
+    assert not has_phi_fast("A 65-year-old man with chest pain.")
+
+
+def test_digit_free_text_only_runs_digit_free_detectors():
+    """Test the digit pre-filter keeps the email detector and drops the rest."""
+    assert [message for _, message in _PHI_NO_DIGIT_PATTERNS] == ["Email address detected"]
+    assert check_for_phi("Email the family at relative@example.org today.")[1] == ["Email address detected"]
+    assert has_phi_fast("relative@example.org")
+    assert not has_phi_fast("No identifiers here.")
+
+
+def test_check_for_phi_truncates_oversized_input():
+    """Test that only the first MAX_PHI_INPUT_CHARS characters are scanned."""
+    padding = "x" * MAX_PHI_INPUT_CHARS
+
+    assert check_for_phi(padding + " SSN 123-45-6789") == (False, ["Input truncated for PHI scan"])
+    assert check_for_phi("SSN 123-45-6789 " + padding) == (
+        True, ["Possible SSN detected", "Input truncated for PHI scan"]
+    )
+    assert not has_phi_fast(padding + " SSN 123-45-6789")
+    # The summary path reports the truncation too, rather than a clean result
+    assert apply_safety_checks(padding + " SSN 123-45-6789", phi_detail=False) == [
+        "[INPUT] Input truncated for PHI scan"
+    ]
+    assert apply_safety_checks(padding + " SSN 123-45-6789") == ["[INPUT] Input truncated for PHI scan"]
+
+
+def test_apply_safety_checks_phi_detail():
+    """Test detailed vs. summary PHI warnings."""
+    question = "MRN 5551234567, presenting with chest pain."
+
+    assert apply_safety_checks(question) == [
+        "[INPUT] Possible MRN detected",
+        "[INPUT] Possible phone number detected",
+    ]
+    assert apply_safety_checks(question, phi_detail=False) == ["[INPUT] Possible PHI detected"]
+    assert apply_safety_checks("Chest pain.", phi_detail=False) == []
+
+
+def test_check_for_phi_returns_independent_lists():
+    """Test that cached results are not shared between callers."""
+    _, first = check_for_phi("Call 555-123-4567")
+    first.append("mutated")
+    _, second = check_for_phi("Call 555-123-4567")
+
+    assert second == ["Possible phone number detected"]
+
+
+def test_check_for_phi_reports_overlapping_patterns():
+    """Test that all matching detectors are reported, in order."""
+    has_phi, warnings = check_for_phi("MRN 5551234567, DOB 1/2/1950")
+
+    assert has_phi
+    assert warnings == [
+        "Possible MRN detected",
+        "Possible phone number detected",
+        "Specific date detected (possible DOB)",
+    ]
+
+
+def test_sanitize_specialty_ids():
+    """Test that invalid IDs are dropped and order/duplicates are kept."""
+    ids = ["cardiology", "cardio", "neurology", "cardiology", ""]
+
+    assert sanitize_specialty_ids(ids) == ["cardiology", "neurology", "cardiology"]
+
+
+def test_validate_planner_output_warnings():
+    """Test planner validation reports invalid IDs, count and score problems in order."""
+    config = Config(provider="mock", model="mock-model")
+    config.budgets.max_specialists = 1
+    result = PlannerResult.model_construct(
+        triage_generalist="emergency_medicine",
+        scored_catalog=[
+            ScoredSpecialty.model_construct(
+                specialty_id="cardiology", relevance=1.5, coverage_gain=0.5,
+                urgency_alignment=0.5, procedural_signal=0.1, reason="r",
+            ),
+            ScoredSpecialty.model_construct(
+                specialty_id="fake_scored", relevance=0.5, coverage_gain=-0.1,
+                urgency_alignment=0.5, procedural_signal=0.1, reason="r",
+            ),
+        ],
+        selected_specialties=["cardiology", "fake_selected"],
+        rationale="",
+    )
+
+    is_valid, warnings = validate_planner_output(result, config)
+
+    assert not is_valid
+    assert warnings == [
+        "Invalid specialty IDs selected: ['fake_selected']",
+        "Invalid specialty IDs in scored catalog: ['fake_scored']",
+        "Too many specialties selected: 2 > 1",
+        "Relevance score out of range for cardiology: 1.5",
+        "Coverage gain out of range for fake_scored: -0.1",
+    ]
+
+
+def test_validate_specialist_output_warnings():
+    """Test specialist warnings, built without schema validation to reach every check."""
+    report = SpecialistReport.model_construct(
+        specialty_id="not_a_specialty",
+        differential=[
+            DifferentialItem.model_construct(dx="A", p=0.9),
+            DifferentialItem.model_construct(dx="B", p=1.2),
+            DifferentialItem.model_construct(dx="C", p=-0.1),
+            DifferentialItem.model_construct(dx="D", p=0.1),
+        ],
+    )
+
+    is_valid, warnings = validate_specialist_output(report)
+
+    assert not is_valid
+    assert warnings == [
+        "Invalid specialty ID: not_a_specialty",
+        "Too many diagnoses in differential: 4 > 3",
+        "Probabilities sum to 2.10 > 1.0",
+        "Probability out of range for B: 1.2",
+        "Probability out of range for C: -0.1",
+    ]
+
+
+def test_apply_safety_checks_fail_fast():
+    """Test that fail_fast stops at the first stage with warnings."""
+    bad_report = SpecialistReport.model_construct(
+        specialty_id="not_a_specialty",
+        differential=[DifferentialItem.model_construct(dx="A", p=0.5)],
+    )
+    reports = [bad_report, bad_report]
+
+    assert apply_safety_checks("Chest pain.", specialist_reports=reports, fail_fast=True) == [
+        "[SPECIALIST:not_a_specialty] Invalid specialty ID: not_a_specialty",
+    ]
+    assert len(apply_safety_checks("Chest pain.", specialist_reports=reports)) == 2
+    assert apply_safety_checks(
+        "MRN 123456", specialist_reports=reports, fail_fast=True
+    ) == ["[INPUT] Possible MRN detected"]
+
+
+@pytest.fixture(params=["re", "re2", "hyperscan"])
+def phi_engine(request, monkeypatch):
+    """Reload src.safety with only the given PHI engine available."""
+    engine = request.param
+    if engine != "re" and importlib.util.find_spec(engine) is None:
+        pytest.skip(f"{engine} is not installed")
+    if engine != "hyperscan":
+        monkeypatch.setitem(sys.modules, "hyperscan", None)
+    if engine == "re":
+        monkeypatch.setitem(sys.modules, "re2", None)
+
+    module = importlib.reload(safety)
+    assert (module._PHI_DATABASE is not None) == (engine == "hyperscan")
+    if engine == "re":
+        assert module._phi_re is importlib.import_module("re")
+    yield module
+
+    monkeypatch.undo()
+    importlib.reload(safety)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("SSN \u0661\u0662\u0663-\u0664\u0665-\u0666\u0667\u0668\u0669", []),  # Arabic-Indic digits
+    ("MRN:\uff11\uff12\uff13", []),  # fullwidth digits
+    ("\u00e9user@example.com", ["Email address detected"]),
+    ("SSN 123-45-6789", ["Possible SSN detected"]),
+])
+def test_phi_detection_is_engine_independent(phi_engine, text, expected):
+    """Test that every PHI engine flags the same non-ASCII texts (ASCII semantics)."""
+    assert phi_engine.check_for_phi(text)[1] == expected
+    assert phi_engine.has_phi_fast(text) == bool(expected)
+
+
+def test_hyperscan_compile_failure_falls_back(monkeypatch):
+    """Test that a Hyperscan compile error disables it instead of failing the import."""
+    class FakeHyperscanError(Exception):
+        pass
+
+    class FakeDatabase:
+        def compile(self, **kwargs):
+            raise FakeHyperscanError("unsupported CPU")
+
+    fake_hyperscan = types.SimpleNamespace(
+        Database=FakeDatabase, error=FakeHyperscanError, HS_FLAG_SINGLEMATCH=0
+    )
+    monkeypatch.setattr(safety, "hyperscan", fake_hyperscan)
+
+    assert safety._compile_phi_database() is None
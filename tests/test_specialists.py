@@ -3,37 +3,20 @@ Tests for specialist agents.
 """
 
 import pytest
+from pydantic import ValidationError
 
-from src.config import Config
-from src.llm_client import MockLLMClient
-from src.schemas import PlannerResult, ScoredSpecialty
+from src.schemas import PlannerResult, ScoredSpecialty, SpecialistReport
 from src.specialists import run_specialist, run_specialists
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    return Config(
-        provider="mock",
-        model="mock-model",
-        temperature=0.3,
-        max_output_tokens=800,
-    )
-
-
-@pytest.fixture
-def mock_llm_client(mock_config):
-    """Create a mock LLM client."""
-    return MockLLMClient(mock_config)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_planner_result():
-    """Create a mock planner result."""
-    return PlannerResult(
+    """Create a mock planner result (shared by the module; treat as read-only)."""
+    # Known-good literals, so validation is skipped
+    return PlannerResult.model_construct(
         triage_generalist="emergency_medicine",
         scored_catalog=[
-            ScoredSpecialty(
+            ScoredSpecialty.model_construct(
                 specialty_id="cardiology",
                 relevance=0.9,
                 coverage_gain=0.8,
@@ -75,8 +58,7 @@ def test_run_specialist_basic(mock_llm_client, mock_config, mock_planner_result)
         assert isinstance(item.discriminators, list)
 
     # Check probabilities sum to <= 1.0
-    total_p = sum(item.p for item in report.differential)
-    assert total_p <= 1.01  # Small tolerance for floating point
+    assert report.total_probability <= 1.01  # Small tolerance for floating point
 
 
 def test_run_specialists_multiple(mock_llm_client, mock_config, mock_planner_result):
@@ -115,3 +97,49 @@ def test_specialist_validates_schema(mock_llm_client, mock_config, mock_planner_
     # Should not raise validation errors
     assert report.specialty_id
     assert report.differential
+
+
+def test_specialist_report_differential_bounds():
+    """Test that empty and oversized differentials are rejected."""
+    item = {"dx": "Dx", "p": 0.2}
+
+    with pytest.raises(ValidationError, match="at least one diagnosis"):
+        SpecialistReport(specialty_id="cardiology", differential=[])
+
+    with pytest.raises(ValidationError):
+        SpecialistReport(specialty_id="cardiology", differential=[item] * 4)
+
+
+def test_specialist_report_total_probability():
+    """Test the probability total and that it stays out of the serialized report."""
+    report = SpecialistReport(
+        specialty_id="cardiology",
+        differential=[{"dx": "A", "p": 0.5}, {"dx": "B", "p": 0.25}],
+    )
+
+    assert report.total_probability == pytest.approx(0.75)
+    assert "total_probability" not in report.model_dump()
+
+
+@pytest.mark.parametrize("max_concurrent_calls", [1, 5])
+def test_run_specialists_keeps_order_and_skips_failures(
+    mock_llm_client, mock_config, mock_planner_result, max_concurrent_calls
+):
+    """Test that results follow the selection order and skip failures, inline or pooled."""
+    config = mock_config.model_copy(update={
+        "safety": mock_config.safety.model_copy(update={"max_concurrent_calls": max_concurrent_calls})
+    })
+    selected = ["neurology", "not_a_specialty", "cardiology", "pulmonology"]
+    calls_before = mock_llm_client.call_count
+
+    results = run_specialists(
+        selected_specialties=selected,
+        question="Test question",
+        options=None,
+        planner_result=mock_planner_result,
+        llm_client=mock_llm_client,
+        config=config
+    )
+
+    assert [report.specialty_id for report, _ in results] == ["neurology", "cardiology", "pulmonology"]
+    assert mock_llm_client.call_count - calls_before == 3